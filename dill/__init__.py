@@ -146,6 +146,21 @@ class GUID:
             (guid.Data4[4] << 24) + (guid.Data4[5] << 16) +
             (guid.Data4[6] << 8) + guid.Data4[7]
         )
+        # GUIDs are immutable and frequently used as dictionary keys, thus
+        # the hash is computed only once
+        self._hash = hash((
+            guid.Data1,
+            guid.Data2,
+            guid.Data3,
+            guid.Data4[0],
+            guid.Data4[1],
+            guid.Data4[2],
+            guid.Data4[3],
+            guid.Data4[4],
+            guid.Data4[5],
+            guid.Data4[6],
+            guid.Data4[7]
+        ))
 
     @property
     def ctypes(self):
@@ -212,19 +227,7 @@ class GUID:
         int
             The has computed from this GUID
         """
-        return hash((
-            self._ctypes_guid.Data1,
-            self._ctypes_guid.Data2,
-            self._ctypes_guid.Data3,
-            self._ctypes_guid.Data4[0],
-            self._ctypes_guid.Data4[1],
-            self._ctypes_guid.Data4[2],
-            self._ctypes_guid.Data4[3],
-            self._ctypes_guid.Data4[4],
-            self._ctypes_guid.Data4[5],
-            self._ctypes_guid.Data4[6],
-            self._ctypes_guid.Data4[7]
-        ))
+        return self._hash
 
 
 GUID_Keyboard = GUID(_GUID_SysKeyboard)
@@ -342,6 +345,11 @@ class DeviceSummary:
     This summary holds static information about a single device's layout.
     """
 
+    __slots__ = (
+        "device_guid", "vendor_id", "product_id", "joystick_id", "name",
+        "axis_count", "button_count", "hat_count", "axis_map", "vjoy_id"
+    )
+
     def __init__(self, data):
         """Creates a new instance.
 
@@ -131,18 +131,16 @@ class CodeRunner:
 
             # Create callbacks fom the user code
             callback_count = 0
-            for dev_id, modes in input_devices.callback_registry.registry.items():
-                for mode, events in modes.items():
-                    for event, callback_list in events.items():
-                        for callback in callback_list.values():
-                            self.event_handler.add_callback(
-                                dev_id,
-                                mode,
-                                event,
-                                callback[0],
-                                callback[1]
-                            )
-                            callback_count += 1
+            for dev_id, mode, event, callback, always_execute in \
+                    input_devices.callback_registry.entries():
+                self.event_handler.add_callback(
+                    dev_id,
+                    mode,
+                    event,
+                    callback,
+                    always_execute
+                )
+                callback_count += 1
 
             # Add a fake keyboard action which does nothing to the callbacks
             # in every mode in order to have empty modes be "present"
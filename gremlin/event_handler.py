@@ -31,6 +31,10 @@ from gremlin import common, config, error, joystick_handling, util, \
     windows_event_hook
 
 
+# Calibration applied to axes without device specific calibration data
+_default_calibration = util.create_calibration_function(-32768, 0, 32767)
+
+
 class Event:
 
     """Represents a single event captured by the system.
@@ -253,7 +257,13 @@ class EventListener(QtCore.QObject):
 
     def _run_device_list_update(self):
         """Performs the update of the devices connected."""
+        # Imported here as input_devices itself depends on this module
+        from gremlin import input_devices
+
         joystick_handling.joystick_devices_initialization()
+        input_devices.JoystickProxy.remove_disconnected(
+            joystick_handling.joystick_devices()
+        )
         self._init_joysticks()
         self.device_change_event.emit()
 
@@ -310,7 +320,7 @@ class EventListener(QtCore.QObject):
         if key in self._calibrations:
             return self._calibrations[key](event.value)
         else:
-            return util.axis_calibration(event.value, -32768, 0, 32767)
+            return _default_calibration(event.value)
 
     def _init_joysticks(self):
         """Initializes joystick devices."""
@@ -353,6 +363,7 @@ class EventHandler(QtCore.QObject):
         self.plugins = {}
         self.callbacks = {}
         self._event_lookup = {}
+        self._mode_tables = {}
         self._active_mode = None
         self._previous_mode = None
 
@@ -403,6 +414,7 @@ class EventHandler(QtCore.QObject):
             self._install_plugins(callback),
             permanent
         ))
+        self._mode_tables = {}
 
     def build_event_lookup(self, modes):
         """Builds the lookup table linking events to callbacks.
@@ -435,6 +447,7 @@ class EventHandler(QtCore.QObject):
                         for event, callbacks in parent_cb.items():
                             if event not in device_cb[child]:
                                 device_cb[child][event] = callbacks
+        self._mode_tables = {}
 
     def change_mode(self, new_mode):
         """Changes the currently active mode.
@@ -479,6 +492,7 @@ class EventHandler(QtCore.QObject):
     def clear(self):
         """Removes all attached callbacks."""
         self.callbacks = {}
+        self._mode_tables = {}
 
     @QtCore.Slot(Event)
     def process_event(self, event):
@@ -506,18 +520,36 @@ class EventHandler(QtCore.QObject):
         :return a list of all callbacks registered and valid for the
             given event
         """
-        # Obtain callbacks matching the event
-        callback_list = []
-        if event.device_guid in self.callbacks:
-            callback_list = self.callbacks[event.device_guid].get(
-                self._active_mode, {}
-            ).get(event, [])
-
-        # Filter events when the system is paused
-        if not self.process_callbacks:
-            return [c[0] for c in callback_list if c[1]]
-        else:
-            return [c[0] for c in callback_list]
+        # Obtain callbacks matching the event, restricting them to those
+        # that are always executed when the system is paused
+        entry = self._mode_table(self._active_mode).get(event)
+        if entry is None:
+            return ()
+        return entry[0] if self.process_callbacks else entry[1]
+
+    def _mode_table(self, mode):
+        """Returns the lookup table of callbacks active in the given mode.
+
+        The table merges the callbacks of all devices for the mode and is
+        built the first time the mode is used, after which it is reused
+        until the callbacks change. Each event maps to a tuple of all its
+        callbacks and a tuple of only those callbacks which are executed
+        even when the system is paused.
+
+        :param mode the mode for which to return the lookup table
+        :return dictionary mapping events to their callbacks in the mode
+        """
+        table = self._mode_tables.get(mode)
+        if table is None:
+            table = {}
+            for device_cb in self.callbacks.values():
+                for event, callback_list in device_cb.get(mode, {}).items():
+                    table[event] = (
+                        tuple(c[0] for c in callback_list),
+                        tuple(c[0] for c in callback_list if c[1])
+                    )
+            self._mode_tables[mode] = table
+        return table
 
     def _install_plugins(self, callback):
         """Installs the current plugins into the given callback.
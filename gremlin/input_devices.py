@@ -21,6 +21,7 @@ import functools
 import heapq
 import inspect
 import logging
+import sys
 import time
 import threading
 from typing import Callable
@@ -31,11 +32,19 @@ import gremlin.common
 import gremlin.keyboard
 import gremlin.types
 from dill import DILL, GUID, GUID_Invalid
+from vjoy.vjoy import make_deadzone
 
 from . import common, error, event_handler, joystick_handling, util
 
 
+# Factor converting raw DILL axis values into the [-1, 1] range
+_axis_scale = 1.0 / 32768.0
 
+# Module level bindings of the functions used to query input states
+_get_axis = DILL.get_axis
+_get_button = DILL.get_button
+_get_hat = DILL.get_hat
+_hat_lookup = util.dill_hat_lookup
 
 
 class CallbackRegistry:
@@ -44,10 +53,10 @@ class CallbackRegistry:
 
     def __init__(self):
         """Creates a new callback registry instance."""
-        self._registry = {}
+        self._flat = {}
         self._current_id = 0
 
-    def add(self, callback, event, mode, always_execute=False):
+    def add(self, callback, event, mode, always_execute=False, name=None):
         """Adds a new callback to the registry.
 
         :param callback function to add as a callback
@@ -55,31 +64,50 @@ class CallbackRegistry:
         :param mode the mode in which to trigger the callback
         :param always_execute if True the callback is run even if Gremlin
             is paused
+        :param name name of the callback, if None the callback's __name__
+            attribute is used
         """
+        if name is None:
+            name = callback.__name__
         self._current_id += 1
-        function_name = "{}_{:d}".format(callback.__name__, self._current_id)
+        function_name = "{}_{:d}".format(name, self._current_id)
+
+        key = (event.device_guid, mode, event)
+        self._flat.setdefault(key, []).append(
+            (function_name, callback, always_execute)
+        )
 
-        if event.device_guid not in self._registry:
-            self._registry[event.device_guid] = {}
-        if mode not in self._registry[event.device_guid]:
-            self._registry[event.device_guid][mode] = {}
+    def entries(self):
+        """Returns an iterator over all registered callbacks.
 
-        if event not in self._registry[event.device_guid][mode]:
-            self._registry[event.device_guid][mode][event] = {}
-        self._registry[event.device_guid][mode][event][function_name] = \
-            (callback, always_execute)
+        :return iterator yielding (device_guid, mode, event, callback,
+            always_execute) tuples
+        """
+        for (device_guid, mode, event), callbacks in self._flat.items():
+            for _, callback, always_execute in callbacks:
+                yield device_guid, mode, event, callback, always_execute
 
     @property
     def registry(self):
         """Returns the registry dictionary.
 
+        The nested device -> mode -> event -> function name structure is
+        reconstructed from the flat storage on each call.
+
         :return registry dictionary
         """
-        return self._registry
+        registry = {}
+        for (device_guid, mode, event), callbacks in self._flat.items():
+            event_dict = registry.setdefault(device_guid, {}) \
+                .setdefault(mode, {}) \
+                .setdefault(event, {})
+            for function_name, callback, always_execute in callbacks:
+                event_dict[function_name] = (callback, always_execute)
+        return registry
 
     def clear(self):
         """Clears the registry entries."""
-        self._registry = {}
+        self._flat = {}
 
 
 class PeriodicRegistry:
@@ -292,6 +320,8 @@ class JoystickWrapper:
 
         """Represents a joystick input."""
 
+        __slots__ = ("_joystick_guid", "_index")
+
         def __init__(self, joystick_guid, index):
             """Creates a new instance.
 
@@ -305,6 +335,8 @@ class JoystickWrapper:
 
         """Represents a single axis of a joystick."""
 
+        __slots__ = ()
+
         def __init__(self, joystick_guid, index):
             super().__init__(joystick_guid, index)
 
@@ -312,31 +344,35 @@ class JoystickWrapper:
         def value(self):
             # FIXME: This bypasses calibration and any other possible
             #        mappings we might do in the future
-            return DILL.get_axis(self._joystick_guid, self._index) / float(32768)
+            return _get_axis(self._joystick_guid, self._index) * _axis_scale
 
     class Button(Input):
 
         """Represents a single button of a joystick."""
 
+        __slots__ = ()
+
         def __init__(self, joystick_guid, index):
             super().__init__(joystick_guid, index)
 
         @property
         def is_pressed(self):
-            return DILL.get_button(self._joystick_guid, self._index)
+            return _get_button(self._joystick_guid, self._index)
 
     class Hat(Input):
 
         """Represents a single hat of a joystick,"""
 
+        __slots__ = ()
+
         def __init__(self, joystick_guid, index):
             super().__init__(joystick_guid, index)
 
         @property
         def direction(self):
-            return util.dill_hat_lookup(
-                DILL.get_hat(self._joystick_guid, self._index)
-            )
+            return _hat_lookup(_get_hat(self._joystick_guid, self._index))
+
+    __slots__ = ("_device_guid", "_info", "_axis", "_buttons", "_hats")
 
     def __init__(self, device_guid):
         """Creates a new wrapper object for the given object id.
@@ -502,7 +538,13 @@ class JoystickProxy:
         :param device_guid GUID of the joystick device
         :return the corresponding joystick device
         """
-        if device_guid not in JoystickProxy.joystick_devices:
+        joy = JoystickProxy.joystick_devices.get(device_guid)
+        if joy is None:
+            if not isinstance(device_guid, GUID):
+                raise error.GremlinError(
+                    "GUID for joystick device expected"
+                )
+
             # If the device exists add process it and add it, otherwise throw
             # an exception
             if DILL.device_exists(device_guid):
@@ -513,7 +555,19 @@ class JoystickProxy:
                     "No device with guid {} exists".format(device_guid)
                 )
 
-        return JoystickProxy.joystick_devices[device_guid]
+        return joy
+
+    @classmethod
+    def remove_disconnected(cls, devices):
+        """Removes the wrappers of devices which are no longer connected.
+
+        :param devices list of currently connected devices
+        """
+        connected = set(dev.device_guid for dev in devices)
+        cls.joystick_devices = {
+            guid: joy for guid, joy in cls.joystick_devices.items()
+            if guid in connected
+        }
 
 
 class VJoyPlugin:
@@ -896,18 +950,18 @@ def _button(button_id, device_guid, mode, always_execute=False):
 
     def wrap(callback):
 
-        @functools.wraps(callback)
-        def wrapper_fn(*args, **kwargs):
-            callback(*args, **kwargs)
+        name = sys.intern(callback.__name__)
 
         event = event_handler.Event(
             event_type=gremlin.types.InputType.JoystickButton,
             device_guid=device_guid,
             identifier=button_id
         )
-        callback_registry.add(wrapper_fn, event, mode, always_execute)
+        callback_registry.add(
+            callback, event, mode, always_execute, name
+        )
 
-        return wrapper_fn
+        return callback
 
     return wrap
 
@@ -924,18 +978,18 @@ def _hat(hat_id, device_guid, mode, always_execute=False):
 
     def wrap(callback):
 
-        @functools.wraps(callback)
-        def wrapper_fn(*args, **kwargs):
-            callback(*args, **kwargs)
+        name = sys.intern(callback.__name__)
 
         event = event_handler.Event(
             event_type=gremlin.types.InputType.JoystickHat,
             device_guid=device_guid,
             identifier=hat_id
         )
-        callback_registry.add(wrapper_fn, event, mode, always_execute)
+        callback_registry.add(
+            callback, event, mode, always_execute, name
+        )
 
-        return wrapper_fn
+        return callback
 
     return wrap
 
@@ -952,18 +1006,18 @@ def _axis(axis_id, device_guid, mode, always_execute=False):
 
     def wrap(callback):
 
-        @functools.wraps(callback)
-        def wrapper_fn(*args, **kwargs):
-            callback(*args, **kwargs)
+        name = sys.intern(callback.__name__)
 
         event = event_handler.Event(
             event_type=gremlin.types.InputType.JoystickAxis,
             device_guid=device_guid,
             identifier=axis_id
         )
-        callback_registry.add(wrapper_fn, event, mode, always_execute)
+        callback_registry.add(
+            callback, event, mode, always_execute, name
+        )
 
-        return wrapper_fn
+        return callback
 
     return wrap
 
@@ -979,15 +1033,15 @@ def keyboard(key_name, mode, always_execute=False):
 
     def wrap(callback):
 
-        @functools.wraps(callback)
-        def wrapper_fn(*args, **kwargs):
-            callback(*args, **kwargs)
+        name = sys.intern(callback.__name__)
 
         key = gremlin.keyboard.key_from_name(key_name)
         event = event_handler.Event.from_key(key)
-        callback_registry.add(wrapper_fn, event, mode, always_execute)
+        callback_registry.add(
+            callback, event, mode, always_execute, name
+        )
 
-        return wrapper_fn
+        return callback
 
     return wrap
 
@@ -1050,6 +1104,21 @@ def squash(value, func):
     return (2 * func(value)) / abs(func(-1) - func(1))
 
 
+def make_squasher(func):
+    """Returns a function computing the values of func squashed to [-1, 1].
+
+    The normalization denominator only depends on the function and is
+    computed once when the squashing function is created, rather than on
+    every evaluation as done by squash. The results are identical to those
+    of squash.
+
+    :param func the function to be squashed
+    :return function returning the squashed value of func at a given value
+    """
+    denominator = abs(func(-1) - func(1))
+    return lambda value: (2 * func(value)) / denominator
+
+
 def deadzone(value, low, low_center, high_center, high):
     """Returns the mapped value taking the provided deadzone into
     account.
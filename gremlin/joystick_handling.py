@@ -45,8 +45,9 @@ class VJoyProxy:
         :param key id of the vjoy device
         :return the corresponding vjoy device
         """
-        if key in VJoyProxy.vjoy_devices:
-            return VJoyProxy.vjoy_devices[key]
+        device = VJoyProxy.vjoy_devices.get(key)
+        if device is not None:
+            return device
         else:
             if not isinstance(key, int):
                 raise error.GremlinError(
@@ -198,11 +199,17 @@ def joystick_devices_initialization():
     )
 
     # Process all connected devices in order to properly initialize the
-    # device registry
+    # device registry, separating physical and virtual devices as we go
     devices = []
+    physical = []
+    virtual = []
     for i in range(dill.DILL.get_device_count()):
         info = dill.DILL.get_device_information_by_index(i)
         devices.append(info)
+        if info.is_virtual:
+            virtual.append(info)
+        else:
+            physical.append(info)
 
     # Process all devices again to detect those that have been added and those
     # that have been removed since the last time this function ran.
@@ -238,7 +245,7 @@ def joystick_devices_initialization():
     # terminate as this is a non-recoverable error.
 
     vjoy_lookup = {}
-    for dev in [dev for dev in devices if dev.is_virtual]:
+    for dev in virtual:
         hash_value = (dev.axis_count, dev.button_count, dev.hat_count)
         syslog.debug(
             "vJoy guid={}: {}".format(dev.device_guid, hash_value)
@@ -311,14 +318,8 @@ def joystick_devices_initialization():
     # Update device list which will be used when queries for joystick devices
     # are made. Order the devices such that vJoy devices are last and the
     # physical devices are ordered by name.
-    sorted_devices = sorted(
-        [dev for dev in devices if not dev.is_virtual],
-        key=lambda x: x.name
-    )
-    sorted_devices.extend(sorted(
-        [dev for dev in devices if dev.is_virtual],
-        key=lambda x: x.vjoy_id
-    ))
+    sorted_devices = sorted(physical, key=lambda x: x.name)
+    sorted_devices.extend(sorted(virtual, key=lambda x: x.vjoy_id))
 
     _joystick_devices = sorted_devices
 
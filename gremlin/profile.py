@@ -121,13 +121,13 @@ def parse_guid(value):
     :param dill.GUID object representing the provided value
     """
     try:
-        tmp = uuid.UUID(value)
+        guid_bytes = uuid.UUID(value).bytes
         raw_guid = dill._GUID()
-        raw_guid.Data1 = int.from_bytes(tmp.bytes[0:4], "big")
-        raw_guid.Data2 = int.from_bytes(tmp.bytes[4:6], "big")
-        raw_guid.Data3 = int.from_bytes(tmp.bytes[6:8], "big")
+        raw_guid.Data1 = int.from_bytes(guid_bytes[0:4], "big")
+        raw_guid.Data2 = int.from_bytes(guid_bytes[4:6], "big")
+        raw_guid.Data3 = int.from_bytes(guid_bytes[6:8], "big")
         for i in range(8):
-            raw_guid.Data4[i] = tmp.bytes[8 + i]
+            raw_guid.Data4[i] = guid_bytes[8 + i]
 
         return dill.GUID(raw_guid)
     except (ValueError, AttributeError) as e:
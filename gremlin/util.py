@@ -42,6 +42,11 @@ from gremlin.types import AxisButtonDirection, AxisMode, HatDirection, \
 # Table storing which modules have been imported already
 g_loaded_modules = {}
 
+# Precompiled regular expressions used by the name validation functions
+_leading_char_re = re.compile(r"[^A-Za-z]")
+_trailing_char_re = re.compile(r"[^A-Za-z0-9]")
+_python_identifier_re = re.compile(r"^[^\d\W]\w*\Z")
+
 
 class FileWatcher(QtCore.QObject):
 
@@ -146,13 +151,13 @@ def parse_guid(value: str) -> dill.GUID:
         dill.GUID object representing the provided value
     """
     try:
-        tmp = uuid.UUID(value)
+        guid_bytes = uuid.UUID(value).bytes
         raw_guid = dill._GUID()
-        raw_guid.Data1 = int.from_bytes(tmp.bytes[0:4], "big")
-        raw_guid.Data2 = int.from_bytes(tmp.bytes[4:6], "big")
-        raw_guid.Data3 = int.from_bytes(tmp.bytes[6:8], "big")
+        raw_guid.Data1 = int.from_bytes(guid_bytes[0:4], "big")
+        raw_guid.Data2 = int.from_bytes(guid_bytes[4:6], "big")
+        raw_guid.Data3 = int.from_bytes(guid_bytes[6:8], "big")
         for i in range(8):
-            raw_guid.Data4[i] = tmp.bytes[8 + i]
+            raw_guid.Data4[i] = guid_bytes[8 + i]
 
         return dill.GUID(raw_guid)
     except (ValueError, AttributeError) as _:
@@ -660,45 +665,6 @@ def is_user_admin():
     return ctypes.windll.shell32.IsUserAnAdmin() == 1
 
 
-def axis_calibration(
-        value: float,
-        minimum: float,
-        center: float,
-        maximum: float
-) -> float:
-    """Returns the calibrated value for a normal style axis.
-
-    Args:
-        value: the raw value to process
-        minimum: the minimum value of the axis
-        center: the center value of the axis
-        maximum: the maximum value of the axis
-
-    Returns:
-        the calibrated value in [-1, 1] corresponding to the provided raw value
-    """
-    value = clamp(value, minimum, maximum)
-    if value < center:
-        return (value - center) / float(center - minimum)
-    else:
-        return (value - center) / float(maximum - center)
-
-
-def slider_calibration(value: float, minimum: float, maximum: float) -> float:
-    """Returns the calibrated value for a slider type axis.
-
-    Args:
-        value: the raw value to process
-        minimum: the minimum value of the axis
-        maximum: the maximum value of the axis
-
-    Returns:
-        the calibrated value in [-1, 1] corresponding to the provided raw value
-    """
-    value = clamp(value, minimum, maximum)
-    return (value - minimum) / float(maximum - minimum) * 2.0 - 1.0
-
-
 def create_calibration_function(
         minimum: float,
         center: float,
@@ -715,10 +681,26 @@ def create_calibration_function(
         function which returns a value in [-1, 1] corresponding
         to the provided raw input value
     """
+    # Precompute the denominators so they are not recomputed for every value
     if minimum == center or maximum == center:
-        return lambda x: slider_calibration(x, minimum, maximum)
+        span = float(maximum - minimum)
+
+        def calibrate(x: float) -> float:
+            return (clamp(x, minimum, maximum) - minimum) / span * 2.0 - 1.0
+
+        return calibrate
     else:
-        return lambda x: axis_calibration(x, minimum, center, maximum)
+        low_span = float(center - minimum)
+        high_span = float(maximum - center)
+
+        def calibrate(x: float) -> float:
+            x = clamp(x, minimum, maximum)
+            if x < center:
+                return (x - center) / low_span
+            else:
+                return (x - center) / high_span
+
+        return calibrate
 
 
 def truncate(text: str, left_size: int, right_size: int) -> str:
@@ -812,8 +794,9 @@ def format_name(name: str) -> str:
     Returns:
         name formatted to be suitable as a python variable name
     """
-    return re.sub("[^A-Za-z]", "", name.lower()[0]) + \
-        re.sub("[^A-Za-z0-9]", "", name.lower()[1:])
+    name = name.lower()
+    return _leading_char_re.sub("", name[0]) + \
+        _trailing_char_re.sub("", name[1:])
 
 
 def valid_python_identifier(name: str) -> bool:
@@ -825,7 +808,7 @@ def valid_python_identifier(name: str) -> bool:
     Returns:
         True if the name is a valid identifier, False otherwise
     """
-    return re.match(r"^[^\d\W]\w*\Z", name) is not None
+    return _python_identifier_re.match(name) is not None
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -844,25 +827,38 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return min(max_val, max(min_val, value))
 
 
+_hat_tuple_to_direction_lookup = {
+    ( 0,  0): "center",
+    ( 0,  1): "north",
+    ( 1,  1): "north-east",
+    ( 1,  0): "east",
+    ( 1, -1): "south-east",
+    ( 0, -1): "south",
+    (-1, -1): "south-west",
+    (-1,  0): "west",
+    (-1,  1): "north-west",
+}
+
 def hat_tuple_to_direction(value):
     """Converts a hat event direction value to it's textual equivalent.
 
     :param value direction tuple from a hat event
     :return textual equivalent of the event tuple
     """
-    lookup = {
-        ( 0,  0): "center",
-        ( 0,  1): "north",
-        ( 1,  1): "north-east",
-        ( 1,  0): "east",
-        ( 1, -1): "south-east",
-        ( 0, -1): "south",
-        (-1, -1): "south-west",
-        (-1,  0): "west",
-        (-1,  1): "north-west",
-    }
-    return lookup[value]
+    return _hat_tuple_to_direction_lookup[value]
+
 
+_hat_direction_to_tuple_lookup = {
+    "center": (0, 0),
+    "north": (0, 1),
+    "north-east": (1, 1),
+    "east": (1, 0),
+    "south-east": (1, -1),
+    "south": (0, -1),
+    "south-west": (-1, -1),
+    "west": (-1, 0),
+    "north-west": (-1, 1)
+}
 
 def hat_direction_to_tuple(value):
     """Converts a direction string to a tuple value.
@@ -870,18 +866,7 @@ def hat_direction_to_tuple(value):
     :param value textual representation of a hat direction
     :return tuple corresponding to the textual direction
     """
-    lookup = {
-        "center": (0, 0),
-        "north": (0, 1),
-        "north-east": (1, 1),
-        "east": (1, 0),
-        "south-east": (1, -1),
-        "south": (0, -1),
-        "south-west": (-1, -1),
-        "west": (-1, 0),
-        "north-west": (-1, 1)
-    }
-    return lookup[value]
+    return _hat_direction_to_tuple_lookup[value]
 
 
 def setup_userprofile() -> None:
@@ -0,0 +1,56 @@
+# -*- coding: utf-8; -*-
+
+# Copyright (C) 2015 - 2022 Lionel Ott
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.input_devices
+
+
+deadzone_limits = [
+    (-1.0, -0.0, 0.0, 1.0),
+    (-1, -0.05, 0.05, 1.0),
+    (-0.9, -0.1, 0.2, 0.8),
+    (-0.7, -0.3, 0.0, 1.0),
+]
+
+sample_values = [i / 20.0 - 1.0 for i in range(41)] + [-0.33, 0.77, 1e-9]
+
+
+@pytest.mark.parametrize("limits", deadzone_limits)
+def test_make_deadzone(limits):
+    deadzone_fn = gremlin.input_devices.make_deadzone(*limits)
+    for value in sample_values:
+        assert deadzone_fn(value) == \
+            gremlin.input_devices.deadzone(value, *limits)
+
+    assert deadzone_fn(1.0) == 1
+    assert deadzone_fn(-1.0) == -1
+
+
+@pytest.mark.parametrize("func", [
+    lambda x: x,
+    lambda x: 3.0 * x,
+    lambda x: x ** 3 + 0.5 * x,
+    lambda x: 0.7 * x - 0.1,
+])
+def test_make_squasher(func):
+    squash_fn = gremlin.input_devices.make_squasher(func)
+    for value in sample_values:
+        assert squash_fn(value) == gremlin.input_devices.squash(value, func)
@@ -145,4 +145,48 @@ def test_read_property():
     with pytest.raises(gremlin.error.ProfileError, match=r"Property element is missing"):
         gremlin.util.read_property(
             doc, "value", gremlin.types.PropertyType.Int
-        )
\ No newline at end of file
+        )
+
+
+def _reference_axis_calibration(value, minimum, center, maximum):
+    value = gremlin.util.clamp(value, minimum, maximum)
+    if value < center:
+        return (value - center) / float(center - minimum)
+    else:
+        return (value - center) / float(maximum - center)
+
+
+def _reference_slider_calibration(value, minimum, maximum):
+    value = gremlin.util.clamp(value, minimum, maximum)
+    return (value - minimum) / float(maximum - minimum) * 2.0 - 1.0
+
+
+def test_create_calibration_function():
+    axis_limits = [(-32768, 0, 32767), (-1000, 37, 1234), (0, 500, 1000)]
+    for minimum, center, maximum in axis_limits:
+        calibrate = gremlin.util.create_calibration_function(
+            minimum, center, maximum
+        )
+        for value in range(minimum - 10, maximum + 11, 7):
+            assert calibrate(value) == _reference_axis_calibration(
+                value, minimum, center, maximum
+            )
+        assert calibrate(minimum) == -1.0
+        assert calibrate(maximum) == 1.0
+
+    slider_limits = [(0, 0, 49), (-100, -100, 1000), (-49, 0, 0)]
+    for minimum, center, maximum in slider_limits:
+        calibrate = gremlin.util.create_calibration_function(
+            minimum, center, maximum
+        )
+        for value in range(minimum - 10, maximum + 11, 3):
+            assert calibrate(value) == _reference_slider_calibration(
+                value, minimum, maximum
+            )
+        assert calibrate(minimum) == -1.0
+        assert calibrate(maximum) == 1.0
+
+    # Degenerate limits only fail once the function is used
+    calibrate = gremlin.util.create_calibration_function(5, 5, 5)
+    with pytest.raises(ZeroDivisionError):
+        calibrate(5)
@@ -173,7 +173,7 @@ class Axis:
         self._max_value = tmp.value
         self._half_range = int(self._max_value / 2)
 
-        self._deadzone_fn = lambda x: deadzone(x, -1.0, -0.0, 0.0, 1.0)
+        self._deadzone_fn = make_deadzone(-1.0, -0.0, 0.0, 1.0)
         self._response_curve_fn = lambda x: x
 
         # If this is not the case our value setter needs to change
@@ -205,8 +205,8 @@ class Axis:
         :param center_high upper center deadzone limit
         :param high high deadzone limit
         """
-        self._deadzone_fn = lambda x: deadzone(
-            x, low, center_low, center_high, high
+        self._deadzone_fn = make_deadzone(
+            low, center_low, center_high, high
         )
 
     @property
@@ -841,3 +841,32 @@ def deadzone(value, low, low_center, high_center, high):
         return min(1, max(0, (value - high_center) / abs(high - high_center)))
     else:
         return max(-1, min(0, (value - low_center) / abs(low - low_center)))
+
+
+def make_deadzone(low, low_center, high_center, high):
+    """Returns a function applying the provided deadzone to input values.
+
+    The deadzone spans are computed once when the function is created,
+    making the returned function preferable to deadzone when the same
+    deadzone is applied repeatedly. The results are identical to those
+    of deadzone.
+
+    The following relationship between the limits has to hold.
+    -1 <= low < low_center <= 0 <= high_center < high <= 1
+
+    :param low low deadzone limit
+    :param low_center lower center deadzone limit
+    :param high_center upper center deadzone limit
+    :param high high deadzone limit
+    :return function mapping a raw input value to the corrected value
+    """
+    low_span = abs(low - low_center)
+    high_span = abs(high - high_center)
+
+    def apply_deadzone(value):
+        if value >= 0:
+            return min(1, max(0, (value - high_center) / high_span))
+        else:
+            return max(-1, min(0, (value - low_center) / low_span))
+
+    return apply_deadzone